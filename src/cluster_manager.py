@@ -16,9 +16,10 @@ import socket
 import threading
 import time
 from datetime import datetime, timezone
+from functools import cached_property
 from typing import Any, Dict, Optional, Tuple
 
-import requests
+import urllib3
 from kubernetes import client, watch
 from kubernetes.client.rest import ApiException
 
@@ -46,12 +47,25 @@ ENABLE_CLUSTER_MANAGEMENT = os.environ.get(
 ).lower() in ("true", "1", "yes")
 HEALTH_CHECK_ENDPOINT = os.environ.get("HEALTH_CHECK_ENDPOINT", "")
 HEALTH_CHECK_INTERVAL = int(os.environ.get("HEALTH_CHECK_INTERVAL", "30"))
+CRD_PROBE_INTERVAL = int(os.environ.get("CRD_PROBE_INTERVAL", "5"))
 
 # CRD configuration
 CRD_GROUP = "cardano.io"
 CRD_VERSION = "v1"
 CRD_PLURAL = "cardanoforgeclusters"
 
+# Shared connection pool for health checks so repeated probes of the same
+# endpoint reuse the TCP connection instead of reconnecting every interval.
+# Failed probes are not retried (the next interval is the retry), but
+# redirects are still followed
+_HEALTH_POOL = urllib3.PoolManager(
+    num_pools=1,
+    maxsize=2,
+    timeout=urllib3.Timeout(connect=2.0, read=8.0),
+    retries=urllib3.Retry(total=None, connect=0, read=0, status=0, other=0, redirect=3),
+    headers={"User-Agent": "cardano-forge-manager/1.0"},
+)
+
 
 # Pool ID validation and utilities
 def validate_pool_id(pool_id: str) -> bool:
@@ -85,21 +99,23 @@ def get_pool_short_id(pool_id: str) -> str:
     return pool_id
 
 
-def get_multi_tenant_cluster_name() -> str:
+def get_multi_tenant_cluster_name(
+    pool_id: str, network: str, region: str, identifier: str
+) -> str:
     """Generate cluster name for multi-tenant deployment."""
-    if POOL_ID and CARDANO_NETWORK and CLUSTER_REGION:
-        pool_short = get_pool_short_id(POOL_ID)
-        return f"{CARDANO_NETWORK}-{pool_short}-{CLUSTER_REGION}"
+    if pool_id and network and region:
+        pool_short = get_pool_short_id(pool_id)
+        return f"{network}-{pool_short}-{region}"
     else:
         # Fall back to legacy naming
-        return CLUSTER_IDENTIFIER
+        return identifier
 
 
-def get_lease_name() -> str:
+def get_lease_name(pool_id: str, network: str) -> str:
     """Generate lease name scoped to network and pool."""
-    if POOL_ID and CARDANO_NETWORK:
-        pool_short = get_pool_short_id(POOL_ID)
-        return f"cardano-leader-{CARDANO_NETWORK}-{pool_short}"
+    if pool_id and network:
+        pool_short = get_pool_short_id(pool_id)
+        return f"cardano-leader-{network}-{pool_short}"
     else:
         # Fall back to legacy naming
         return "cardano-node-leader"
@@ -160,10 +176,6 @@ class ClusterForgeManager:
         if not config_valid:
             raise ValueError(f"Invalid multi-tenant configuration: {config_message}")
 
-        # Multi-tenant identification
-        self.cluster_id = get_multi_tenant_cluster_name()
-        self.lease_name = get_lease_name()
-
         # Network and pool configuration
         self.network = CARDANO_NETWORK
         self.network_magic = NETWORK_MAGIC
@@ -174,6 +186,7 @@ class ClusterForgeManager:
         self.application_type = APPLICATION_TYPE
 
         # Legacy compatibility
+        self.cluster_identifier = CLUSTER_IDENTIFIER
         self.region = CLUSTER_REGION
         self.environment = CLUSTER_ENVIRONMENT
         self.priority = CLUSTER_PRIORITY
@@ -185,15 +198,37 @@ class ClusterForgeManager:
         self._effective_priority = self.priority
         self._last_health_check = None
         self._consecutive_health_failures = 0
+        self._watch_healthy = True
+        self._watch_down_ts: Optional[datetime] = None
+        self._last_good_metrics: Dict[str, Any] = {}
         self._watch_thread: Optional[threading.Thread] = None
         self._health_thread: Optional[threading.Thread] = None
+        self._probe_timer: Optional[threading.Timer] = None
         self._shutdown_event = threading.Event()
 
         logger.info(
-            f"Cluster manager initialized: enabled={self.enabled}, cluster={self.cluster_id}, "
-            f"network={self.network}, pool={self.pool_id or 'legacy'}, region={self.region}, priority={self.priority}"
+            "Cluster manager initialized: enabled=%s, cluster=%s, "
+            "network=%s, pool=%s, region=%s, priority=%s",
+            self.enabled,
+            self.cluster_id,
+            self.network,
+            self.pool_id or "legacy",
+            self.region,
+            self.priority,
+        )
+
+    @cached_property
+    def cluster_id(self) -> str:
+        """Cluster name for this instance, computed once on first access."""
+        return get_multi_tenant_cluster_name(
+            self.pool_id, self.network, self.region, self.cluster_identifier
         )
 
+    @cached_property
+    def lease_name(self) -> str:
+        """Lease name scoped to this instance's network and pool."""
+        return get_lease_name(self.pool_id, self.network)
+
     def start(self):
         """Start cluster management threads if enabled."""
         if not self.enabled:
@@ -202,6 +237,18 @@ class ClusterForgeManager:
             )
             return
 
+        if not self._crd_installed():
+            logger.info(
+                "CardanoForgeCluster CRD not installed, probing every %ss",
+                CRD_PROBE_INTERVAL,
+            )
+            self._schedule_crd_probe()
+            return
+
+        self._start_watchers()
+
+    def _start_watchers(self):
+        """Ensure our cluster CRD object exists and start the watch/health threads."""
         try:
             # Ensure CRD exists or create it
             self._ensure_cluster_crd()
@@ -219,10 +266,10 @@ class ClusterForgeManager:
                     target=self._health_check_loop, daemon=True
                 )
                 self._health_thread.start()
-                logger.info(f"Started health check thread for {HEALTH_CHECK_ENDPOINT}")
+                logger.info("Started health check thread for %s", HEALTH_CHECK_ENDPOINT)
 
         except Exception as e:
-            logger.error(f"Failed to start cluster management: {e}")
+            logger.error("Failed to start cluster management: %s", e)
             self.enabled = False
 
     def stop(self):
@@ -230,11 +277,52 @@ class ClusterForgeManager:
         logger.info("Stopping cluster management")
         self._shutdown_event.set()
 
-        if self._watch_thread and self._watch_thread.is_alive():
-            self._watch_thread.join(timeout=5)
+        if self._probe_timer:
+            self._probe_timer.cancel()
 
-        if self._health_thread and self._health_thread.is_alive():
-            self._health_thread.join(timeout=5)
+        # Both loops wait on the same event, so join them against one deadline
+        deadline = time.monotonic() + 5
+        for thread in (self._watch_thread, self._health_thread):
+            if thread and thread.is_alive():
+                thread.join(timeout=max(0.0, deadline - time.monotonic()))
+
+    def _crd_installed(self) -> bool:
+        """Check API discovery for the CardanoForgeCluster resource type."""
+        try:
+            resource_list = self.api.get_api_resources(
+                group=CRD_GROUP, version=CRD_VERSION
+            )
+        except ApiException as e:
+            if e.status == 404:
+                return False
+            logger.warning("Could not probe for CardanoForgeCluster CRD: %s", e)
+            return True
+        except Exception as e:
+            logger.warning("Could not probe for CardanoForgeCluster CRD: %s", e)
+            return True
+
+        return any(r.name == CRD_PLURAL for r in resource_list.resources or [])
+
+    def _schedule_crd_probe(self):
+        """Re-check for the CRD after CRD_PROBE_INTERVAL seconds."""
+        self._probe_timer = threading.Timer(
+            CRD_PROBE_INTERVAL, self._probe_crd_installed
+        )
+        self._probe_timer.daemon = True
+        self._probe_timer.start()
+
+    def _probe_crd_installed(self):
+        """Timer callback: start watching once the CRD appears."""
+        if self._shutdown_event.is_set():
+            return
+
+        if self._crd_installed():
+            logger.info(
+                "CardanoForgeCluster CRD installed, starting cluster management"
+            )
+            self._start_watchers()
+        else:
+            self._schedule_crd_probe()
 
     def should_allow_local_leadership(self) -> Tuple[bool, str]:
         """
@@ -253,7 +341,8 @@ class ClusterForgeManager:
             return True, "cluster_management_disabled"
 
         if not self._current_cluster_crd:
-            # If CRD doesn't exist, default to allowing leadership (backward compatibility)
+            # If CRD doesn't exist, default to allowing leadership
+            # (backward compatibility)
             return True, "no_cluster_crd"
 
         try:
@@ -281,7 +370,7 @@ class ClusterForgeManager:
             )
 
         except Exception as e:
-            logger.error(f"Error evaluating cluster leadership: {e}")
+            logger.error("Error evaluating cluster leadership: %s", e)
             return True, "evaluation_error"
 
     def should_allow_forging(self) -> Tuple[bool, str]:
@@ -329,7 +418,7 @@ class ClusterForgeManager:
             return True, "default_allow"
 
         except Exception as e:
-            logger.error(f"Error evaluating cluster forging policy: {e}")
+            logger.error("Error evaluating cluster forging policy: %s", e)
             return True, "evaluation_error"
 
     def update_leader_status(self, pod_name: Optional[str], is_leader: bool):
@@ -351,25 +440,24 @@ class ClusterForgeManager:
             )
 
             logger.debug(
-                f"Updated cluster CRD status: leader={pod_name}, is_leader={is_leader}, "
-                f"effectiveState={status_patch['status']['effectiveState']}, "
-                f"effectivePriority={status_patch['status']['effectivePriority']}"
+                "Updated cluster CRD status: leader=%s, is_leader=%s, "
+                "effectiveState=%s, effectivePriority=%s",
+                pod_name,
+                is_leader,
+                status_patch["status"]["effectiveState"],
+                status_patch["status"]["effectivePriority"],
             )
 
         except ApiException as e:
-            logger.warning(f"Failed to update cluster CRD status: {e}")
+            logger.warning("Failed to update cluster CRD status: %s", e)
         except Exception as e:
-            logger.error(f"Unexpected error updating cluster CRD status: {e}")
-
-    def get_cluster_metrics(self) -> Dict[str, Any]:
-        """Get current cluster state for metrics export."""
-        if not self.enabled:
-            return {"enabled": False}
+            logger.error("Unexpected error updating cluster CRD status: %s", e)
 
+    @cached_property
+    def _metrics_identity(self) -> Dict[str, Any]:
+        """Static part of the metrics payload, built once per instance."""
         return {
             "enabled": True,
-            "forge_enabled": self._cluster_forge_enabled,
-            "effective_priority": self._effective_priority,
             "cluster_id": self.cluster_id,
             "region": self.region,
             # Multi-tenant information
@@ -377,6 +465,39 @@ class ClusterForgeManager:
             "pool_id": self.pool_id,
             "pool_ticker": self.pool_ticker,
             "application_type": self.application_type,
+        }
+
+    def get_cluster_metrics(self) -> Dict[str, Any]:
+        """Get current cluster state for metrics export.
+
+        While the CRD watch is disconnected the watch-derived fields come from
+        the last snapshot taken from a watch event, flagged with ``stale`` and
+        ``stale_since``. ``health_status`` comes from the local health thread
+        and stays live.
+        """
+        if not self.enabled:
+            return {"enabled": False}
+
+        # Read the outage timestamp once: the watch thread may reconnect and
+        # clear it between the health check and its use
+        down_ts = self._watch_down_ts
+        live = self._snapshot_metrics()
+        if not self._watch_healthy and down_ts is not None:
+            return {
+                **(self._last_good_metrics or live),
+                "health_status": live["health_status"],
+                "stale": True,
+                "stale_since": down_ts.isoformat(),
+            }
+
+        return live
+
+    def _snapshot_metrics(self) -> Dict[str, Any]:
+        """Build the metrics payload from the current in-memory state."""
+        return {
+            **self._metrics_identity,
+            "forge_enabled": self._cluster_forge_enabled,
+            "effective_priority": self._effective_priority,
             "health_status": {
                 "healthy": self._consecutive_health_failures == 0,
                 "consecutive_failures": self._consecutive_health_failures,
@@ -399,15 +520,15 @@ class ClusterForgeManager:
                 plural=CRD_PLURAL,
                 name=self.cluster_id,
             )
-            logger.info(f"Found existing CardanoForgeCluster CRD: {self.cluster_id}")
+            logger.info("Found existing CardanoForgeCluster CRD: %s", self.cluster_id)
 
         except ApiException as e:
             if e.status == 404:
                 # Create new CRD
-                logger.info(f"Creating CardanoForgeCluster CRD: {self.cluster_id}")
+                logger.info("Creating CardanoForgeCluster CRD: %s", self.cluster_id)
                 self._create_cluster_crd()
             else:
-                logger.error(f"Error checking CardanoForgeCluster CRD: {e}")
+                logger.error("Error checking CardanoForgeCluster CRD: %s", e)
                 raise
 
     def _create_cluster_crd(self):
@@ -503,10 +624,10 @@ class ClusterForgeManager:
                 plural=CRD_PLURAL,
                 body=crd_body,
             )
-            logger.info(f"Created CardanoForgeCluster CRD: {self.cluster_id}")
+            logger.info("Created CardanoForgeCluster CRD: %s", self.cluster_id)
 
         except ApiException as e:
-            logger.error(f"Failed to create CardanoForgeCluster CRD: {e}")
+            logger.error("Failed to create CardanoForgeCluster CRD: %s", e)
             raise
 
     def _watch_cluster_crd(self):
@@ -527,12 +648,15 @@ class ClusterForgeManager:
                     if self._shutdown_event.is_set():
                         break
 
+                    self._mark_watch_healthy()
                     event_type = event["type"]
                     obj = event["object"]
                     obj_name = obj.get("metadata", {}).get("name", "")
 
                     if obj_name == self.cluster_id:
-                        logger.debug(f"Received CRD event: {event_type} for {obj_name}")
+                        logger.debug(
+                            "Received CRD event: %s for %s", event_type, obj_name
+                        )
                         self._handle_cluster_crd_change(obj)
 
                 w.stop()
@@ -542,15 +666,32 @@ class ClusterForgeManager:
                     logger.info("CRD watch resource version expired, restarting")
                     continue
                 else:
-                    logger.error(f"CRD watch error: {e}")
-                    time.sleep(5)
+                    logger.error("CRD watch error: %s", e)
+                    self._mark_watch_down()
+                    self._shutdown_event.wait(5)
 
             except Exception as e:
-                logger.error(f"Unexpected CRD watch error: {e}")
-                time.sleep(5)
+                logger.error("Unexpected CRD watch error: %s", e)
+                self._mark_watch_down()
+                self._shutdown_event.wait(5)
 
         logger.info("CardanoForgeCluster CRD watch stopped")
 
+    def _mark_watch_healthy(self):
+        """Record that the CRD watch is delivering events again."""
+        if not self._watch_healthy:
+            logger.info(
+                "CRD watch reconnected after outage since %s", self._watch_down_ts
+            )
+        self._watch_healthy = True
+        self._watch_down_ts = None
+
+    def _mark_watch_down(self):
+        """Record that the CRD watch lost contact with the API server."""
+        if self._watch_healthy:
+            self._watch_healthy = False
+            self._watch_down_ts = datetime.now(timezone.utc)
+
     def _handle_cluster_crd_change(self, crd_obj: Dict[str, Any]):
         """Handle changes to our cluster's CRD."""
         try:
@@ -584,23 +725,33 @@ class ClusterForgeManager:
 
             if old_forge_enabled != self._cluster_forge_enabled:
                 logger.info(
-                    f"Cluster forge state changed: {old_forge_enabled} -> {self._cluster_forge_enabled} (effective_state: {effective_state})"
+                    "Cluster forge state changed: %s -> %s (effective_state: %s)",
+                    old_forge_enabled,
+                    self._cluster_forge_enabled,
+                    effective_state,
                 )
 
             # If spec changed, proactively update status to ensure effectiveState/effectivePriority are current
             if spec_changed or not crd_obj.get("status", {}).get("effectiveState"):
                 logger.info(
-                    f"Spec changed or status missing effective fields, updating comprehensive status: "
-                    f"forgeState={forge_state}, priority={base_priority} -> effective_state={effective_state}, effective_priority={effective_priority}"
+                    "Spec changed or status missing effective fields, "
+                    "updating comprehensive status: forgeState=%s, priority=%s "
+                    "-> effective_state=%s, effective_priority=%s",
+                    forge_state,
+                    base_priority,
+                    effective_state,
+                    effective_priority,
                 )
                 self.update_comprehensive_status()
 
+            self._last_good_metrics = self._snapshot_metrics()
+
         except Exception as e:
-            logger.error(f"Error handling cluster CRD change: {e}")
+            logger.error("Error handling cluster CRD change: %s", e)
 
     def _health_check_loop(self):
         """Perform periodic health checks."""
-        logger.info(f"Starting health check loop for {HEALTH_CHECK_ENDPOINT}")
+        logger.info("Starting health check loop for %s", HEALTH_CHECK_ENDPOINT)
 
         while not self._shutdown_event.is_set():
             try:
@@ -611,21 +762,17 @@ class ClusterForgeManager:
                     break
 
             except Exception as e:
-                logger.error(f"Health check loop error: {e}")
-                time.sleep(5)
+                logger.error("Health check loop error: %s", e)
+                self._shutdown_event.wait(5)
 
         logger.info("Health check loop stopped")
 
     def _perform_health_check(self):
         """Perform a single health check."""
         try:
-            response = requests.get(
-                HEALTH_CHECK_ENDPOINT,
-                timeout=10,
-                headers={"User-Agent": "cardano-forge-manager/1.0"},
-            )
+            response = _HEALTH_POOL.request("GET", HEALTH_CHECK_ENDPOINT)
 
-            healthy = response.status_code == 200
+            healthy = response.status == 200
             self._last_health_check = datetime.now(timezone.utc)
 
             if healthy:
@@ -634,23 +781,27 @@ class ClusterForgeManager:
                 self._consecutive_health_failures += 1
 
             logger.debug(
-                f"Health check: {healthy}, consecutive failures: {self._consecutive_health_failures}"
+                "Health check: %s, consecutive failures: %s",
+                healthy,
+                self._consecutive_health_failures,
             )
 
             # Update CRD status if needed
-            self._update_health_status(healthy, f"HTTP {response.status_code}")
+            self._update_health_status(healthy, f"HTTP {response.status}")
 
-        except requests.RequestException as e:
+        except urllib3.exceptions.HTTPError as e:
             self._consecutive_health_failures += 1
             self._last_health_check = datetime.now(timezone.utc)
 
             logger.warning(
-                f"Health check failed: {e}, consecutive failures: {self._consecutive_health_failures}"
+                "Health check failed: %s, consecutive failures: %s",
+                e,
+                self._consecutive_health_failures,
             )
             self._update_health_status(False, str(e))
 
         except Exception as e:
-            logger.error(f"Unexpected health check error: {e}")
+            logger.error("Unexpected health check error: %s", e)
 
     def _update_health_status(self, healthy: bool, message: str):
         """Update the health status in the CRD."""
@@ -679,12 +830,12 @@ class ClusterForgeManager:
             )
 
         except Exception as e:
-            logger.warning(f"Failed to update health status: {e}")
+            logger.warning("Failed to update health status: %s", e)
 
     def _build_comprehensive_status_update(
         self, pod_name: Optional[str], is_leader: bool
     ) -> Dict[str, Any]:
-        """Build comprehensive status update including all required CRD status fields."""
+        """Build a status update including all required CRD status fields."""
         if not self._current_cluster_crd:
             return {"status": {}}
 
@@ -740,7 +891,7 @@ class ClusterForgeManager:
             return status_update
 
         except Exception as e:
-            logger.error(f"Error building comprehensive status update: {e}")
+            logger.error("Error building comprehensive status update: %s", e)
             # Fallback to minimal update
             return {
                 "status": {
@@ -780,7 +931,9 @@ class ClusterForgeManager:
                             )
                             if datetime.now(timezone.utc) > expire_time:
                                 logger.info(
-                                    f"Override expired at {expires_at}, reverting to normal operation"
+                                    "Override expired at %s, "
+                                    "reverting to normal operation",
+                                    expires_at,
                                 )
                             else:
                                 # Override is active
@@ -796,7 +949,9 @@ class ClusterForgeManager:
                                     reason = "manual_override"
 
                                 logger.debug(
-                                    f"Active override: state={effective_state}, priority={effective_priority}"
+                                    "Active override: state=%s, priority=%s",
+                                    effective_state,
+                                    effective_priority,
                                 )
                                 return (
                                     effective_state,
@@ -805,7 +960,9 @@ class ClusterForgeManager:
                                     message,
                                 )
                         except Exception as e:
-                            logger.warning(f"Error processing override expiration: {e}")
+                            logger.warning(
+                                "Error processing override expiration: %s", e
+                            )
 
             # Apply health-based adjustments (if no override)
             if effective_state == "Priority-based" and hasattr(
@@ -845,7 +1002,7 @@ class ClusterForgeManager:
             return effective_state, effective_priority, reason, message
 
         except Exception as e:
-            logger.error(f"Error calculating effective state: {e}")
+            logger.error("Error calculating effective state: %s", e)
             return (
                 forge_state,
                 base_priority,
@@ -879,15 +1036,17 @@ class ClusterForgeManager:
             )
 
             logger.debug(
-                f"Updated comprehensive CRD status: effectiveState={status_patch['status']['effectiveState']}, "
-                f"effectivePriority={status_patch['status']['effectivePriority']}, "
-                f"reason={status_patch['status']['reason']}"
+                "Updated comprehensive CRD status: effectiveState=%s, "
+                "effectivePriority=%s, reason=%s",
+                status_patch["status"]["effectiveState"],
+                status_patch["status"]["effectivePriority"],
+                status_patch["status"]["reason"],
             )
 
         except ApiException as e:
-            logger.warning(f"Failed to update comprehensive CRD status: {e}")
+            logger.warning("Failed to update comprehensive CRD status: %s", e)
         except Exception as e:
-            logger.error(f"Unexpected error updating comprehensive CRD status: {e}")
+            logger.error("Unexpected error updating comprehensive CRD status: %s", e)
 
 
 # Backward compatibility - create a global instance that can be disabled
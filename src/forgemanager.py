@@ -7,6 +7,8 @@ This sidecar manages leader election, credential distribution, and process signa
 for Cardano block producer nodes running in Kubernetes.
 """
 
+import json
+import hashlib
 import logging
 import os
 import psutil
@@ -17,10 +19,11 @@ import stat
 import threading
 import time
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from http.server import BaseHTTPRequestHandler, HTTPServer
-from typing import Optional
+from typing import Iterable, Iterator, Optional, Tuple
 from urllib.parse import urlparse
-from kubernetes import client, config
+from kubernetes import client, config, watch
 from kubernetes.client.rest import ApiException
 from prometheus_client import Counter, Gauge, Info, generate_latest
 
@@ -46,6 +49,8 @@ DISABLE_SOCKET_CHECK = os.environ.get("DISABLE_SOCKET_CHECK", "false").lower() i
 )
 LEASE_NAME = os.environ.get("LEASE_NAME", "cardano-node-leader")
 LEASE_DURATION = int(os.environ.get("LEASE_DURATION", 15))  # seconds
+MAX_LEASE_RETRIES = int(os.environ.get("MAX_LEASE_RETRIES", 3))
+CRD_RESYNC_INTERVAL = int(os.environ.get("CRD_RESYNC_INTERVAL", 60))  # seconds
 METRICS_PORT = int(os.environ.get("METRICS_PORT", 8000))
 LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO")
 
@@ -149,8 +154,14 @@ except Exception:
     config.load_kube_config()
     logger.info("Loaded local Kubernetes configuration")
 
-custom_objects = client.CustomObjectsApi()
-coord_api = client.CoordinationV1Api()
+# One ApiClient for every API group so lease, CRD and watch calls share a
+# keep-alive connection pool instead of each opening their own
+k8s_config = client.Configuration.get_default_copy()
+k8s_config.connection_pool_maxsize = 32
+api_client = client.ApiClient(k8s_config)
+
+custom_objects = client.CustomObjectsApi(api_client)
+coord_api = client.CoordinationV1Api(api_client)
 
 # Initialize cluster management
 cluster_manager.initialize_cluster_manager(custom_objects, POD_NAME, NAMESPACE)
@@ -169,12 +180,47 @@ last_crd_leader_state = None
 last_crd_forging_state = None
 # Track whether we've synced our in-memory CRD state with the live CRD
 crd_status_initialized = False
+last_crd_sync_time = 0.0  # time.monotonic() of our last CRD status write
+# Content digests of credential files: path -> (stat key, digest)
+_digest_cache: dict = {}
+# Lease holder last reported by the lease watch
+last_watched_lease_holder: Optional[str] = None
+# Set by the lease watch when the holder changes, to wake the main loop early
+lease_changed = threading.Event()
+lease_watch_stop = threading.Event()
 
 # -----------------------------
 # Process Management Functions
 # -----------------------------
 
 
+def _iter_proc_infos() -> Iterator[dict]:
+    """Yield the pid/name/cmdline info dict of every visible process."""
+    for proc in psutil.process_iter(["pid", "name", "cmdline"]):
+        yield proc.info
+
+
+def _find_cardano_pid(proc_infos: Iterable[dict]) -> Optional[int]:
+    """Return the PID of the first cardano-node entry in proc_infos, if any."""
+    for info in proc_infos:
+        if info["name"] == CARDANO_NODE_PROCESS_NAME:
+            logger.debug(
+                f"Found {CARDANO_NODE_PROCESS_NAME} process with PID {info['pid']}"
+            )
+            return info["pid"]
+        # Also check command line for cardano-node; NUL-joining keeps a
+        # match from spanning two arguments
+        if info["cmdline"] and CARDANO_NODE_PROCESS_NAME in "\x00".join(
+            info["cmdline"]
+        ):
+            logger.debug(
+                f"Found {CARDANO_NODE_PROCESS_NAME} in cmdline with PID "
+                f"{info['pid']}"
+            )
+            return info["pid"]
+    return None
+
+
 def discover_cardano_node_pid() -> Optional[int]:
     """Discover the cardano-node process PID.
 
@@ -183,22 +229,9 @@ def discover_cardano_node_pid() -> Optional[int]:
     but if not found, we'll rely on socket-based detection instead.
     """
     try:
-        for proc in psutil.process_iter(["pid", "name", "cmdline"]):
-            if proc.info["name"] == CARDANO_NODE_PROCESS_NAME:
-                logger.debug(
-                    f"Found {CARDANO_NODE_PROCESS_NAME} process with PID "
-                    f"{proc.info['pid']}"
-                )
-                return proc.info["pid"]
-            # Also check command line for cardano-node
-            if proc.info["cmdline"] and any(
-                CARDANO_NODE_PROCESS_NAME in arg for arg in proc.info["cmdline"]
-            ):
-                logger.debug(
-                    f"Found {CARDANO_NODE_PROCESS_NAME} in cmdline with PID "
-                    f"{proc.info['pid']}"
-                )
-                return proc.info["pid"]
+        pid = _find_cardano_pid(_iter_proc_infos())
+        if pid is not None:
+            return pid
 
         # If not found, log this as debug (not error) since it's expected
         # in multi-container setups
@@ -264,6 +297,14 @@ def send_sighup_to_cardano_node(reason: str = "credential_change") -> bool:
         return False
 
 
+def get_socket_mode() -> Optional[int]:
+    """Return st_mode of NODE_SOCKET, or None if it does not exist."""
+    try:
+        return os.stat(NODE_SOCKET).st_mode
+    except OSError:
+        return None
+
+
 def is_node_in_startup_phase() -> bool:
     """Detect if cardano-node is in startup phase vs running normally.
 
@@ -272,8 +313,11 @@ def is_node_in_startup_phase() -> bool:
     """
     global node_startup_phase, cardano_node_pid
 
+    # One stat() answers both "exists" and "is it a socket"
+    socket_mode = get_socket_mode()
+
     # If socket doesn't exist, node is definitely in startup
-    if not os.path.exists(NODE_SOCKET):
+    if socket_mode is None:
         if not node_startup_phase:
             logger.info("Node socket disappeared - node entering startup/restart phase")
             # Forfeit leadership immediately when node dies/restarts
@@ -288,29 +332,24 @@ def is_node_in_startup_phase() -> bool:
 
     # If we were in startup phase and socket now exists, check if it's stable
     if node_startup_phase:
-        try:
-            # Check that it's actually a socket
-            if stat.S_ISSOCK(os.stat(NODE_SOCKET).st_mode):
-                logger.info("Node startup phase complete - socket is ready and stable")
-                node_startup_phase = False
-
-                # Try to discover PID for potential signaling, but don't require it
-                current_pid = discover_cardano_node_pid()
-                if current_pid:
-                    cardano_node_pid = current_pid
-                    logger.debug(f"Cached cardano-node PID: {current_pid}")
-                else:
-                    logger.info(
-                        "Running in cross-container mode - "
-                        "process signaling not available"
-                    )
-
-                return False
+        # Check that it's actually a socket
+        if stat.S_ISSOCK(socket_mode):
+            logger.info("Node startup phase complete - socket is ready and stable")
+            node_startup_phase = False
+
+            # Try to discover PID for potential signaling, but don't require it
+            current_pid = discover_cardano_node_pid()
+            if current_pid:
+                cardano_node_pid = current_pid
+                logger.debug(f"Cached cardano-node PID: {current_pid}")
             else:
-                logger.debug(f"File {NODE_SOCKET} exists but is not a socket")
-                return True
-        except Exception as e:
-            logger.debug(f"Socket stability check failed: {e}")
+                logger.info(
+                    "Running in cross-container mode - process signaling not available"
+                )
+
+            return False
+        else:
+            logger.debug(f"File {NODE_SOCKET} exists but is not a socket")
             return True
 
     return node_startup_phase
@@ -353,11 +392,14 @@ def provision_startup_credentials() -> bool:
 
 def forfeit_leadership():
     """Forfeit current leadership due to node restart/failure."""
-    global current_leadership_state
+    global current_leadership_state, crd_status_initialized
 
     if not current_leadership_state:
         return  # Nothing to forfeit
 
+    # The CRD is about to be cleared, so our cached status no longer applies
+    crd_status_initialized = False
+
     logger.warning("Forfeiting leadership due to cardano-node restart")
 
     # Clear leadership state immediately
@@ -367,79 +409,69 @@ def forfeit_leadership():
     # Clean up credentials immediately
     ensure_secrets(is_leader=False, send_sighup=False)
 
-    # Check current CRD status before clearing to avoid race condition
-    # Only clear if we're still shown as the leader in the CRD
+    # Clear the CRD only while it still names us. The JSON patch "test" op
+    # makes that check part of the write itself, so there is no window
+    # between reading the CRD and patching it
+    patch_ops = [
+        {"op": "test", "path": "/status/leaderPod", "value": POD_NAME},
+        {"op": "replace", "path": "/status/leaderPod", "value": ""},
+        {"op": "add", "path": "/status/forgingEnabled", "value": False},
+        {
+            "op": "add",
+            "path": "/status/lastTransitionTime",
+            "value": _format_k8s_time(datetime.now(timezone.utc)),
+        },
+    ]
     try:
-        current_crd = custom_objects.get_namespaced_custom_object_status(
+        custom_objects.patch_namespaced_custom_object_status(
             group=CRD_GROUP,
             version=CRD_VERSION,
             namespace=NAMESPACE,
             plural=CRD_PLURAL,
             name=CRD_NAME,
+            body=patch_ops,
+            _content_type="application/json-patch+json",
         )
-
-        # Check if we're still the recorded leader
-        current_leader = current_crd.get("status", {}).get("leaderPod", "")
-
-        if current_leader != POD_NAME:
-            logger.info(
-                f"Not clearing CRD status - another pod "
-                f"({current_leader or 'none'}) is now leader"
-            )
-            # Update local metrics but don't touch CRD
-            update_metrics(is_leader=False)
-            return
-
-        # We're still the recorded leader, safe to clear the status
-        logger.info(
-            f"Clearing CRD status - we ({POD_NAME}) are still the recorded leader"
-        )
-
+        logger.info("Leadership forfeited - CRD status cleared")
     except ApiException as e:
         if e.status == 404:
             logger.info("CRD not found during leadership forfeiture - nothing to clear")
-            update_metrics(is_leader=False)
-            return
+        elif e.status in (409, 422):
+            # The test op failed: the CRD no longer names us
+            logger.info("Not clearing CRD status - another pod is now leader")
         else:
-            logger.warning(f"Could not check CRD status during forfeiture: {e}")
-            logger.info("Proceeding with caution to clear status anyway")
-
-    # Update CRD to clear leadership status
-    status_body = {
-        "status": {
-            "leaderPod": "",
-            "forgingEnabled": False,
-            "lastTransitionTime": datetime.now(timezone.utc).isoformat(),
-        }
-    }
-    try:
-        custom_objects.patch_namespaced_custom_object_status(
-            group=CRD_GROUP,
-            version=CRD_VERSION,
-            namespace=NAMESPACE,
-            plural=CRD_PLURAL,
-            name=CRD_NAME,
-            body=status_body,
-        )
-        logger.info("Leadership forfeited - CRD status cleared")
-    except ApiException as e:
-        logger.error(f"Failed to clear CRD status during leadership forfeiture: {e}")
+            logger.error(
+                f"Failed to clear CRD status during leadership forfeiture: {e}"
+            )
 
     # Update local metrics
     update_metrics(is_leader=False)
 
 
-def update_leader_status(is_leader: bool):
+def update_leader_status(
+    is_leader: bool, forging_decision: Optional[Tuple[bool, str]] = None
+):
     """Update CardanoLeader CRD status with current leadership and forging state.
 
     CRITICAL: If we hold the lease (is_leader=True), we MUST write our pod name
-    to the CRD.
-    This ensures the CRD always reflects the current lease holder, regardless
-    of previous state.
+    to the CRD, so it converges on the current lease holder whatever its
+    previous state.
+    The staleness of that write is bounded: a leader whose last successful
+    write still matches its state skips the API call until
+    CRD_RESYNC_INTERVAL has passed. An external change to status.leaderPod
+    (a manual edit, a stale ex-leader) is therefore overwritten within
+    CRD_RESYNC_INTERVAL seconds rather than on the next tick. Only the
+    CardanoLeader patch is skipped; a leader still refreshes the
+    CardanoForgeCluster status every tick.
     Non-leaders should not overwrite the CRD unless they need to clear stale data.
     """
-    # Get forging permission from cluster manager
-    forging_allowed, forging_reason = cluster_manager.should_allow_forging()
+    global last_crd_leader_state, last_crd_forging_state
+    global last_crd_sync_time, crd_status_initialized
+
+    # Get forging permission from cluster manager unless already evaluated
+    forging_allowed, forging_reason = (
+        forging_decision or cluster_manager.should_allow_forging()
+    )
     # Only forge if we're leader AND cluster allows forging
     forging_enabled = is_leader and forging_allowed
 
@@ -448,12 +480,33 @@ def update_leader_status(is_leader: bool):
     should_update = False
 
     if is_leader:
-        # ALWAYS update when we hold the lease - this is the source of truth
+        if (
+            crd_status_initialized
+            and last_crd_leader_state == POD_NAME
+            and last_crd_forging_state == forging_enabled
+            and time.monotonic() - last_crd_sync_time < CRD_RESYNC_INTERVAL
+        ):
+            logger.debug("CRD status unchanged since last write - skipping update")
+            # The cluster CRD carries state (effective priority, health) that
+            # can change without touching this one, so it is still refreshed
+            cluster_manager.update_cluster_leader_status(POD_NAME, forging_enabled)
+            return
+        # Update when we hold the lease - this is the source of truth
         should_update = True
         logger.debug(
             f"Leader update: Writing {POD_NAME} to CRD (forging: {forging_enabled})"
         )
+    elif last_crd_leader_state not in (POD_NAME, None):
+        # Only we write our own name, so while not leader the CRD cannot have
+        # gone back to showing us - no need to read it
+        crd_status_initialized = False
+        logger.debug(
+            f"Non-leader: CRD last showed {last_crd_leader_state or 'none'} "
+            f"as leader, no update needed"
+        )
     else:
+        # Another pod may write the CRD while we are not leader
+        crd_status_initialized = False
         # Non-leader: Check if CRD incorrectly shows us as leader and clear it
         try:
             current_crd = custom_objects.get_namespaced_custom_object_status(
@@ -467,6 +520,7 @@ def update_leader_status(is_leader: bool):
                 current_crd.get("status", {}) if isinstance(current_crd, dict) else {}
             )
             live_leader = live_status.get("leaderPod", "")
+            last_crd_leader_state = live_leader
 
             if live_leader == POD_NAME:
                 # CRD incorrectly shows us as leader - we must clear it
@@ -491,7 +545,7 @@ def update_leader_status(is_leader: bool):
         "status": {
             "leaderPod": POD_NAME if is_leader else "",
             "forgingEnabled": forging_enabled,
-            "lastTransitionTime": datetime.now(timezone.utc).isoformat(),
+            "lastTransitionTime": _format_k8s_time(datetime.now(timezone.utc)),
         }
     }
     try:
@@ -509,6 +563,10 @@ def update_leader_status(is_leader: bool):
             f"forgingEnabled={forging_enabled} (cluster allows: {forging_allowed}, "
             f"reason: {forging_reason})"
         )
+        last_crd_leader_state = POD_NAME if is_leader else ""
+        last_crd_forging_state = forging_enabled
+        last_crd_sync_time = time.monotonic()
+        crd_status_initialized = True
 
         # Also update cluster CRD if cluster management is enabled
         cluster_manager.update_cluster_leader_status(
@@ -516,27 +574,42 @@ def update_leader_status(is_leader: bool):
         )
 
     except ApiException as e:
+        crd_status_initialized = False
         logger.error(f"Failed to update CRD status: {e}")
 
 
-def update_metrics(is_leader: bool):
+@lru_cache(maxsize=16)
+def _pod_metric_children(labels: tuple) -> tuple:
+    """Return the (leader_status, forging_enabled) children bound to labels."""
+    return leader_status.labels(*labels), forging_enabled.labels(*labels)
+
+
+@lru_cache(maxsize=16)
+def _cluster_metric_children(labels: tuple) -> tuple:
+    """Return the (cluster_forge_enabled, cluster_forge_priority) children."""
+    return cluster_forge_enabled.labels(*labels), cluster_forge_priority.labels(*labels)
+
+
+def update_metrics(
+    is_leader: bool, forging_decision: Optional[Tuple[bool, str]] = None
+):
     """Update Prometheus metrics with current leadership and forging state."""
-    # Get forging permission from cluster manager
-    forging_allowed, forging_reason = cluster_manager.should_allow_forging()
+    # Get forging permission from cluster manager unless already evaluated
+    forging_allowed, forging_reason = (
+        forging_decision or cluster_manager.should_allow_forging()
+    )
     # Only forge if we're leader AND cluster allows forging
     forging_enabled_actual = is_leader and forging_allowed
 
-    # Use multi-tenant labels
+    # Use multi-tenant labels (pod, network, pool_id, application); the bound
+    # children are cached so each tick skips the labels() lookup
     pool_id_short = POOL_ID[:10] if POOL_ID else "unknown"
-    labels = {
-        "pod": POD_NAME,
-        "network": CARDANO_NETWORK,
-        "pool_id": pool_id_short,
-        "application": APPLICATION_TYPE,
-    }
+    leader_child, forging_child = _pod_metric_children(
+        (POD_NAME, CARDANO_NETWORK, pool_id_short, APPLICATION_TYPE)
+    )
 
-    leader_status.labels(**labels).set(1 if is_leader else 0)
-    forging_enabled.labels(**labels).set(1 if forging_enabled_actual else 0)
+    leader_child.set(1 if is_leader else 0)
+    forging_child.set(1 if forging_enabled_actual else 0)
 
     # Update cluster-wide metrics if available
     cluster_metrics = cluster_manager.get_cluster_metrics()
@@ -547,20 +620,14 @@ def update_metrics(is_leader: bool):
         pool_id = cluster_metrics.get("pool_id", "unknown")
         pool_id_short = pool_id[:10] if pool_id and pool_id != "unknown" else "unknown"
 
-        cluster_labels = {
-            "cluster": cluster_id,
-            "region": region,
-            "network": network,
-            "pool_id": pool_id_short,
-        }
-
-        cluster_forge_enabled.labels(**cluster_labels).set(
-            1 if cluster_metrics.get("forge_enabled", False) else 0
-        )
-        cluster_forge_priority.labels(**cluster_labels).set(
-            cluster_metrics.get("effective_priority", 999)
+        # Labels: cluster, region, network, pool_id
+        enabled_child, priority_child = _cluster_metric_children(
+            (cluster_id, region, network, pool_id_short)
         )
 
+        enabled_child.set(1 if cluster_metrics.get("forge_enabled", False) else 0)
+        priority_child.set(cluster_metrics.get("effective_priority", 999))
+
     logger.debug(
         f"Metrics updated: leader={is_leader}, "
         f"forging={forging_enabled_actual} (cluster allows: {forging_allowed}, "
@@ -615,12 +682,12 @@ def wait_for_socket(timeout: int = 0) -> bool:
         return True
 
     timeout = timeout or SOCKET_WAIT_TIMEOUT
-    start_time = time.time()
+    start_time = time.monotonic()
 
     logger.info(f"Waiting for node socket: {NODE_SOCKET} (timeout: {timeout}s)")
 
-    while not os.path.exists(NODE_SOCKET):
-        if time.time() - start_time > timeout:
+    while (socket_mode := get_socket_mode()) is None:
+        if time.monotonic() - start_time > timeout:
             logger.warning(
                 f"Timeout waiting for node socket: {NODE_SOCKET} after {timeout}s"
             )
@@ -628,24 +695,30 @@ def wait_for_socket(timeout: int = 0) -> bool:
         time.sleep(1)
 
     # Additional check that it's actually a socket
-    try:
-        if stat.S_ISSOCK(os.stat(NODE_SOCKET).st_mode):
-            logger.info(f"Node socket found and verified: {NODE_SOCKET}")
-            return True
-        else:
-            logger.warning(f"File {NODE_SOCKET} exists but is not a socket")
-            return False
-    except Exception as e:
-        logger.warning(f"Could not verify socket {NODE_SOCKET}: {e}")
-        return True  # Assume it's valid to avoid blocking
+    if stat.S_ISSOCK(socket_mode):
+        logger.info(f"Node socket found and verified: {NODE_SOCKET}")
+        return True
+    else:
+        logger.warning(f"File {NODE_SOCKET} exists but is not a socket")
+        return False
 
 
-def ensure_secrets(is_leader: bool, send_sighup: bool = True) -> bool:
-    """Ensure credential state matches forging permission."""
+def ensure_secrets(
+    is_leader: bool,
+    send_sighup: bool = True,
+    forging_decision: Optional[Tuple[bool, str]] = None,
+) -> bool:
+    """Ensure credential state matches forging permission.
+
+    forging_decision is this tick's cluster_manager.should_allow_forging()
+    result; it is evaluated here when not given.
+    """
     credentials_changed = False
 
     # Check if we should actually forge (leader + cluster allows forging)
-    forging_allowed, forging_reason = cluster_manager.should_allow_forging()
+    forging_allowed, forging_reason = (
+        forging_decision or cluster_manager.should_allow_forging()
+    )
     should_have_credentials = is_leader and forging_allowed
 
     # Define credential files using direct environment variables
@@ -685,29 +758,39 @@ def ensure_secrets(is_leader: bool, send_sighup: bool = True) -> bool:
     return credentials_changed
 
 
+def _file_digest(path: str, st: os.stat_result) -> bytes:
+    """Return the BLAKE2b-128 digest of path, reusing it while the file is unchanged."""
+    key = (st.st_size, st.st_mtime_ns, st.st_ctime_ns, st.st_ino)
+    cached = _digest_cache.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    with open(path, "rb") as f:
+        digest = hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16))
+    _digest_cache[path] = (key, digest.digest())
+    return _digest_cache[path][1]
+
+
 def files_identical(file1: str, file2: str) -> bool:
-    """Check if two files are identical."""
-    try:
-        if not (os.path.exists(file1) and os.path.exists(file2)):
-            return False
+    """Check if two files are identical.
 
+    Files up to 1MB are compared by content digest, cached per path until
+    the file's stat changes; larger files are assumed identical when size
+    and mtime (within 1 second) match.
+    """
+    try:
         stat1 = os.stat(file1)
         stat2 = os.stat(file2)
 
-        # Quick size check first
+        # Quick size check first, no reads needed
         if stat1.st_size != stat2.st_size:
             return False
-
-        # Compare modification times
-        if abs(stat1.st_mtime - stat2.st_mtime) < 1:  # Within 1 second
+        if os.path.samestat(stat1, stat2) or stat1.st_size == 0:
             return True
 
-        # Fallback to content comparison for small files
-        if stat1.st_size < 1024 * 1024:  # 1MB
-            with open(file1, "rb") as f1, open(file2, "rb") as f2:
-                return f1.read() == f2.read()
+        if stat1.st_size > 1024 * 1024:  # 1MB
+            return abs(stat1.st_mtime_ns - stat2.st_mtime_ns) < 1_000_000_000
 
-        return False
+        return _file_digest(file1, stat1) == _file_digest(file2, stat2)
     except Exception:
         return False
 
@@ -785,6 +868,60 @@ def calculate_exponential_backoff(
 # -----------------------------
 
 
+# Layouts tried after the fixed-width fast path, in order
+_K8S_TIME_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S.%fZ",  # fractional seconds with fewer than six digits
+    "%Y-%m-%dT%H:%M:%SZ",
+    "%Y-%m-%dT%H:%M:%S.%f%z",  # +00:00 offset (ISO 8601 with timezone offset)
+    "%Y-%m-%dT%H:%M:%S%z",  # +00:00 offset without microseconds
+)
+
+
+@lru_cache(maxsize=512)
+def _parse_k8s_time_str(time_str: str) -> datetime:
+    """Parse a Kubernetes timestamp string; raises ValueError if unparseable.
+
+    Cached because the same renewTime is seen on every tick until the
+    holder renews. Failures raise rather than return, so they are not cached.
+    """
+    # Fast path: the API server always sends YYYY-MM-DDTHH:MM:SS[.ffffff]Z, so
+    # slice the fixed layout instead of going through strptime
+    n = len(time_str)
+    if (
+        (n == 20 or (n == 27 and time_str[19] == "."))
+        and time_str[-1] == "Z"
+        and time_str[10] == "T"
+    ):
+        try:
+            return datetime(
+                int(time_str[0:4]),
+                int(time_str[5:7]),
+                int(time_str[8:10]),
+                int(time_str[11:13]),
+                int(time_str[14:16]),
+                int(time_str[17:19]),
+                int(time_str[20:26]) if n == 27 else 0,
+                tzinfo=timezone.utc,
+            )
+        except ValueError:
+            pass
+    for fmt in _K8S_TIME_FORMATS:
+        try:
+            parsed = datetime.strptime(time_str, fmt)
+        except ValueError:
+            continue
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+    raise ValueError(time_str)
+
+
+def _format_k8s_time(dt: datetime) -> str:
+    """Format an aware UTC datetime as a Kubernetes MicroTime string (ISO with Z).
+
+    This is the layout the parse_k8s_time fast path reads back.
+    """
+    return dt.isoformat(timespec="microseconds").replace("+00:00", "Z")
+
+
 def parse_k8s_time(time_val) -> datetime:
     """Parse Kubernetes timestamp (str or datetime) to timezone-aware datetime (UTC)."""
     if not time_val:
@@ -795,25 +932,10 @@ def parse_k8s_time(time_val) -> datetime:
     # Otherwise, expect string
     time_str = str(time_val)
     try:
-        return datetime.strptime(time_str, "%Y-%m-%dT%H:%M:%S.%fZ").replace(
-            tzinfo=timezone.utc
-        )
+        return _parse_k8s_time_str(time_str)
     except ValueError:
-        try:
-            return datetime.strptime(time_str, "%Y-%m-%dT%H:%M:%SZ").replace(
-                tzinfo=timezone.utc
-            )
-        except ValueError:
-            try:
-                # Handle +00:00 timezone format (ISO 8601 with timezone offset)
-                return datetime.strptime(time_str, "%Y-%m-%dT%H:%M:%S.%f%z")
-            except ValueError:
-                try:
-                    # Handle +00:00 timezone format without microseconds
-                    return datetime.strptime(time_str, "%Y-%m-%dT%H:%M:%S%z")
-                except ValueError:
-                    logger.warning(f"Could not parse timestamp: {time_str}")
-                    return datetime.now(timezone.utc)
+        logger.warning(f"Could not parse timestamp: {time_str}")
+        return datetime.now(timezone.utc)
 
 
 def get_lease():
@@ -832,7 +954,7 @@ def create_lease():
     """Create new lease object."""
     from kubernetes.client import V1Lease, V1LeaseSpec, V1ObjectMeta
 
-    now = datetime.now(timezone.utc).isoformat()
+    now = _format_k8s_time(datetime.now(timezone.utc))
     lease = V1Lease(
         metadata=V1ObjectMeta(name=LEASE_NAME),
         spec=V1LeaseSpec(
@@ -858,7 +980,7 @@ def create_lease():
 
 def patch_lease(lease):
     """Update lease with current timestamp using optimistic concurrency control."""
-    lease.spec.renew_time = datetime.now(timezone.utc).isoformat()
+    lease.spec.renew_time = _format_k8s_time(datetime.now(timezone.utc))
 
     # Use resource version for optimistic concurrency control
     # This prevents race conditions when multiple pods try to update the same lease
@@ -888,24 +1010,16 @@ def try_acquire_leader() -> bool:
     # This ensures the CRD is always kept up-to-date even when forging is
     # disabled.
 
-    max_retries = 3
-    for attempt in range(max_retries):
+    for attempt in range(MAX_LEASE_RETRIES):
         try:
             # Always get fresh lease state to avoid stale reads
             lease = get_lease()
             now = datetime.now(timezone.utc)
 
             if not lease:
-                try:
-                    lease = create_lease()
-                    # If lease creation succeeded, we might be able to claim it
-                    # but we need to get the fresh state after creation
-                    lease = get_lease()
-                except ApiException as e:
-                    if e.status == 409:  # Already exists
-                        lease = get_lease()  # Get the existing lease
-                    else:
-                        raise
+                # The create response (or, on 409, the re-read inside
+                # create_lease) is already fresh server state
+                lease = create_lease()
 
             if not lease:
                 logger.warning("Could not get lease even after creation attempt")
@@ -940,7 +1054,7 @@ def try_acquire_leader() -> bool:
             if can_acquire:
                 old_holder = holder
                 lease.spec.holder_identity = POD_NAME
-                lease.spec.renew_time = now.isoformat()
+                lease.spec.renew_time = _format_k8s_time(now)
 
                 # Increment lease transitions when taking over from
                 # another holder
@@ -979,23 +1093,25 @@ def try_acquire_leader() -> bool:
                     return True
 
                 except ApiException as e:
-                    if e.status == 409:  # Conflict - someone else got it
-                        logger.debug(
-                            f"Lease acquisition conflict (409) - "
-                            f"attempt {attempt + 1}/{max_retries}"
-                        )
-                        if attempt < max_retries - 1:
-                            # Wait with exponential backoff before retrying
-                            backoff_delay = calculate_exponential_backoff(attempt)
-                            logger.debug(f"Retrying after {backoff_delay:.2f}s backoff")
-                            time.sleep(backoff_delay)
-                            continue
-                        else:
-                            logger.debug("Max retries reached for lease acquisition")
-                            return False  # Failed to acquire lease after all retries
-                    else:
+                    if e.status != 409:
+                        # Retried by the generic handler below
                         logger.error(f"Unexpected error acquiring lease: {e}")
                         raise
+
+                    # Conflict - someone else updated the lease first
+                    logger.debug(
+                        f"Lease acquisition conflict (409) - "
+                        f"attempt {attempt + 1}/{MAX_LEASE_RETRIES}"
+                    )
+                    if attempt == MAX_LEASE_RETRIES - 1:
+                        logger.debug("Max retries reached for lease acquisition")
+                        return False  # Failed to acquire lease after all retries
+
+                    # Wait with exponential backoff before retrying
+                    backoff_delay = calculate_exponential_backoff(attempt)
+                    logger.debug(f"Retrying after {backoff_delay:.2f}s backoff")
+                    time.sleep(backoff_delay)
+                    continue
             else:
                 # Cannot acquire lease - check if we lost leadership
                 if current_leadership_state and holder != POD_NAME:
@@ -1024,19 +1140,107 @@ def try_acquire_leader() -> bool:
 
         except Exception as e:
             logger.error(f"Error in leader election attempt {attempt + 1}: {e}")
-            if attempt < max_retries - 1:
+            if attempt < MAX_LEASE_RETRIES - 1:
                 backoff_delay = calculate_exponential_backoff(attempt, base_delay=1.0)
                 logger.debug(f"Retrying after error backoff: {backoff_delay:.2f}s")
                 time.sleep(backoff_delay)
                 continue
             else:
-                logger.error(f"Leader election failed after {max_retries} attempts")
+                logger.error(
+                    f"Leader election failed after {MAX_LEASE_RETRIES} attempts"
+                )
                 return False
 
     # Fallback - should not reach here
     return current_leadership_state
 
 
+# -----------------------------
+# Lease Watch
+# -----------------------------
+
+
+def handle_lease_event(event: dict) -> bool:
+    """Record a lease watch event; wake the main loop if the holder changed."""
+    global last_watched_lease_holder
+
+    lease = event["object"]
+    if event["type"] == "DELETED":
+        holder = None
+    else:
+        holder = getattr(lease.spec, "holder_identity", None) or None
+
+    if holder == last_watched_lease_holder:
+        # Renewals by the current holder need no action
+        return False
+
+    logger.debug(
+        f"Lease holder changed: {last_watched_lease_holder or 'none'} -> "
+        f"{holder or 'none'}"
+    )
+    last_watched_lease_holder = holder
+    lease_changed.set()
+    return True
+
+
+def watch_lease():
+    """Watch our Lease object and wake the main loop on holder changes.
+
+    The main loop still ticks every SLEEP_INTERVAL: the leader has to renew
+    and an expired lease produces no event, so the watch only cuts how long
+    the other pods take to notice a handover.
+    """
+    resource_version = None
+    while not lease_watch_stop.is_set():
+        try:
+            w = watch.Watch()
+            for event in w.stream(
+                coord_api.list_namespaced_lease,
+                namespace=NAMESPACE,
+                field_selector=f"metadata.name={LEASE_NAME}",
+                resource_version=resource_version,
+                timeout_seconds=300,
+            ):
+                if lease_watch_stop.is_set():
+                    break
+                resource_version = event["object"].metadata.resource_version
+                handle_lease_event(event)
+            w.stop()
+
+        except ApiException as e:
+            if e.status == 410:  # Resource version too old
+                logger.info("Lease watch resource version expired, restarting")
+                resource_version = None
+                continue
+            if e.status == 403:
+                logger.warning(
+                    "No permission to watch leases - relying on polling only"
+                )
+                return
+            logger.error(f"Lease watch error: {e}")
+            lease_watch_stop.wait(5)
+
+        except Exception as e:
+            logger.error(f"Unexpected lease watch error: {e}")
+            lease_watch_stop.wait(5)
+
+    logger.info("Lease watch stopped")
+
+
+def start_lease_watch():
+    """Start the lease watch in a background thread."""
+    lease_watch_stop.clear()
+    threading.Thread(target=watch_lease, daemon=True).start()
+    logger.info(f"Started lease watch for {LEASE_NAME}")
+
+
+def wait_for_lease_change(timeout: float) -> bool:
+    """Sleep up to timeout seconds, returning True early if the lease holder changed."""
+    changed = lease_changed.wait(timeout)
+    lease_changed.clear()
+    return changed
+
+
 # -----------------------------
 # HTTP Server for Metrics and Startup Status
 # -----------------------------
@@ -1081,8 +1285,6 @@ class ForgeManagerHTTPHandler(BaseHTTPRequestHandler):
                         "credentials_provisioned": startup_credentials_provisioned,
                         "timestamp": datetime.now(timezone.utc).isoformat(),
                     }
-                    import json
-
                     self.wfile.write(json.dumps(response).encode())
                 else:
                     self.send_response(503)  # Service Unavailable
@@ -1094,8 +1296,6 @@ class ForgeManagerHTTPHandler(BaseHTTPRequestHandler):
                         "credentials_provisioned": startup_credentials_provisioned,
                         "timestamp": datetime.now(timezone.utc).isoformat(),
                     }
-                    import json
-
                     self.wfile.write(json.dumps(response).encode())
             except Exception as e:
                 logger.error(f"Error checking startup status: {e}")
@@ -1216,6 +1416,8 @@ def main():
     if not in_startup:
         startup_cleanup()
 
+    start_lease_watch()
+
     logger.info(f"Starting main leadership election loop (interval: {SLEEP_INTERVAL}s)")
 
     try:
@@ -1257,9 +1459,14 @@ def main():
                 is_leader = try_acquire_leader()
                 logger.debug(f"Leadership acquisition result: {is_leader}")
 
+                # Evaluate the cluster forging policy once for this tick
+                forging_decision = cluster_manager.should_allow_forging()
+
                 # Ensure credential state matches leadership (normal operation)
                 logger.debug(f"Ensuring secrets for leader status: {is_leader}")
-                credentials_changed = ensure_secrets(is_leader)
+                credentials_changed = ensure_secrets(
+                    is_leader, forging_decision=forging_decision
+                )
                 if credentials_changed:
                     logger.info(
                         f"Credentials {'provisioned' if is_leader else 'removed'} "
@@ -1268,17 +1475,19 @@ def main():
 
                 # Update status and metrics
                 logger.debug("Updating CRD status and metrics")
-                update_leader_status(is_leader)
-                update_metrics(is_leader)
+                update_leader_status(is_leader, forging_decision)
+                update_metrics(is_leader, forging_decision)
 
                 # Sleep until next iteration with jitter to prevent
-                # synchronized wake-ups
+                # synchronized wake-ups, or until the lease watch reports a
+                # new holder
                 jittered_sleep = calculate_jittered_sleep(SLEEP_INTERVAL)
                 logger.debug(
                     f"Sleeping for {jittered_sleep:.2f}s "
                     f"(base: {SLEEP_INTERVAL}s + jitter)"
                 )
-                time.sleep(jittered_sleep)
+                if wait_for_lease_change(jittered_sleep):
+                    logger.debug("Lease holder changed - re-running election early")
 
             except KeyboardInterrupt:
                 logger.info("Received interrupt signal, shutting down gracefully")
@@ -1291,6 +1500,8 @@ def main():
     except KeyboardInterrupt:
         logger.info("Shutting down gracefully...")
     finally:
+        lease_watch_stop.set()
+
         # Cleanup on shutdown
         if current_leadership_state:
             logger.info("Cleaning up credentials before shutdown")
@@ -1304,6 +1515,16 @@ def main():
         logger.info("Cardano Forge Manager shutdown complete")
 
 
+def validate_environment():
+    """Log any missing required environment variable; return True if all are set."""
+    valid = True
+    for name, value in (("POD_NAME", POD_NAME), ("NAMESPACE", NAMESPACE)):
+        if not value:
+            logger.error(f"{name} environment variable is required")
+            valid = False
+    return valid
+
+
 def signal_handler(signum, frame):
     """Handle termination signals gracefully."""
     logger.info(f"Received signal {signum}, initiating graceful shutdown")
@@ -1317,11 +1538,7 @@ if __name__ == "__main__":
     signal.signal(signal.SIGINT, signal_handler)
 
     # Validate required environment variables
-    if not POD_NAME:
-        logger.error("POD_NAME environment variable is required")
-        exit(1)
-    if not NAMESPACE:
-        logger.error("NAMESPACE environment variable is required")
+    if not validate_environment():
         exit(1)
 
     main()
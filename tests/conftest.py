@@ -0,0 +1,28 @@
+# tests/conftest.py
+"""Shared pytest configuration for the test suite."""
+
+import pytest
+
+# Markers whose classes share a worker, in order of precedence
+_SHARED_GROUP_MARKERS = ("k8s", "proc")
+
+
+def pytest_collection_modifyitems(items):
+    """Put each TestCase class in a pytest-xdist group.
+
+    With ``--dist loadgroup`` a class then runs on a single worker, so its
+    setUpClass fixtures (shared temp dirs, the shared cluster manager) are
+    built once rather than once per worker. Classes marked ``k8s`` or
+    ``proc`` share one group per marker, keeping the classes that drive the
+    same mocks on the same worker. Workers are separate processes, and each
+    class resets the module state it touches in setUp, so groups can safely
+    run in parallel.
+    """
+    for item in items:
+        if item.cls is None or item.get_closest_marker("xdist_group"):
+            continue
+        group = next(
+            (name for name in _SHARED_GROUP_MARKERS if item.get_closest_marker(name)),
+            f"{item.module.__name__}.{item.cls.__name__}",
+        )
+        item.add_marker(pytest.mark.xdist_group(group))
@@ -1,116 +1,132 @@
 #!/usr/bin/env python3
 
+import logging
 import os
 import stat
 import sys
+from functools import lru_cache
 
+import pytest
 
-def test_socket_detection():
-    """Test socket detection logic"""
-    NODE_SOCKET = "/ipc/node.socket"
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+NODE_SOCKET = "/ipc/node.socket"
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
-    print(f"Testing socket detection for: {NODE_SOCKET}")
 
-    # Check if socket exists
-    socket_exists = os.path.exists(NODE_SOCKET)
-    print(f"Socket exists: {socket_exists}")
+def _scan_proc(name):
+    """Yield (pid, comm, cmdline) for matching processes straight from /proc.
 
-    if socket_exists:
+    Only ``comm`` is read for every PID; ``cmdline`` is read when the name
+    does not already match.
+    """
+    needle = name.encode()
+    for entry in os.scandir("/proc"):
+        if not entry.name.isdigit():
+            continue
         try:
-            # Check if it's actually a socket
-            is_socket = stat.S_ISSOCK(os.stat(NODE_SOCKET).st_mode)
-            print(f"Is valid socket: {is_socket}")
-
-            if is_socket:
-                print("✅ Socket detection: PASS - Node should be considered ready")
-                assert True, "Socket is valid"
-            else:
-                print("❌ Socket detection: FAIL - File exists but not a socket")
-                assert False, "File exists but is not a socket"
-        except Exception as e:
-            print(f"❌ Socket detection: ERROR - {e}")
-            assert False, f"Socket detection error: {e}"
+            with open(f"/proc/{entry.name}/comm") as f:
+                comm = f.read().rstrip("\n")
+            if comm == name:
+                yield int(entry.name), comm, ()
+                continue
+            with open(f"/proc/{entry.name}/cmdline", "rb") as f:
+                raw = f.read()
+        except OSError:
+            # Process exited or is not readable
+            continue
+        # cmdline is already NUL-separated, so one search covers every arg
+        if needle in raw:
+            yield int(entry.name), comm, tuple(
+                arg.decode(errors="replace") for arg in raw.split(b"\x00") if arg
+            )
+
+
+@lru_cache(maxsize=None)
+def _find_processes(name):
+    """Return matching (pid, name, cmdline) tuples; scanned once per name."""
+    if sys.platform == "linux":
+        return tuple(_scan_proc(name))
+
+    return tuple(
+        (proc.info["pid"], proc.info["name"], tuple(proc.info["cmdline"] or ()))
+        for proc in psutil.process_iter(["pid", "name", "cmdline"])
+        if proc.info["name"] == name or name in "\x00".join(proc.info["cmdline"] or ())
+    )
+
+
+@lru_cache(maxsize=None)
+def _socket_mode(path):
+    """Return st_mode for path from a single stat() call, or None if missing."""
+    try:
+        return os.stat(path).st_mode
+    except FileNotFoundError:
+        return None
+
+
+@pytest.fixture(scope="module")
+def socket_mode():
+    """st_mode of the node socket, or None if it does not exist."""
+    return _socket_mode(NODE_SOCKET)
+
+
+def test_socket_detection(socket_mode):
+    """Test socket detection logic"""
+    logger.debug("Testing socket detection for: %s", NODE_SOCKET)
+
+    # One stat() answers both "exists" and "is it a socket"
+    logger.debug("Socket exists: %s", socket_mode is not None)
+
+    if socket_mode is not None:
+        # Check if it's actually a socket
+        is_socket = stat.S_ISSOCK(socket_mode)
+        logger.debug("Is valid socket: %s", is_socket)
+        assert is_socket, "File exists but is not a socket"
+        logger.debug("Socket detection: PASS - node should be considered ready")
     else:
-        print("⚠️ Socket detection: Node not ready - socket missing")
         # Missing socket is expected in test environment
-        assert True, "Socket missing is expected in test environment"
+        logger.debug("Socket detection: node not ready - socket missing")
 
 
 def test_process_discovery():
     """Test process discovery logic"""
-    import psutil
-
     CARDANO_NODE_PROCESS_NAME = "cardano-node"
-    print(f"Testing process discovery for: {CARDANO_NODE_PROCESS_NAME}")
-
-    found_processes = []
-    try:
-        for proc in psutil.process_iter(["pid", "name", "cmdline"]):
-            if proc.info["name"] == CARDANO_NODE_PROCESS_NAME:
-                found_processes.append(f"By name: PID {proc.info['pid']}")
-            elif proc.info["cmdline"] and any(
-                CARDANO_NODE_PROCESS_NAME in arg for arg in proc.info["cmdline"]
-            ):
-                found_processes.append(
-                    f"By cmdline: PID {proc.info['pid']} - {' '.join(proc.info['cmdline'][:3])}"
-                )
-    except Exception as e:
-        print(f"❌ Process discovery: ERROR - {e}")
-        assert False, f"Process discovery error: {e}"
-
-    if found_processes:
-        print("✅ Process discovery: FOUND")
-        for proc in found_processes:
-            print(f"  - {proc}")
-        assert True, "Process found successfully"
-    else:
-        print("⚠️ Process discovery: NOT FOUND - Expected in cross-container setup")
-        # Not finding the process is expected in test environment
-        assert True, "Process not found is expected in test environment"
+    if sys.platform != "linux" and psutil is None:
+        pytest.skip("psutil not available")
+    logger.debug("Testing process discovery for: %s", CARDANO_NODE_PROCESS_NAME)
 
+    found = _find_processes(CARDANO_NODE_PROCESS_NAME)
+    for pid, name, cmdline in found:
+        if name == CARDANO_NODE_PROCESS_NAME:
+            logger.debug("Found by name: PID %d", pid)
+        else:
+            logger.debug("Found by cmdline: PID %d - %s", pid, " ".join(cmdline[:3]))
 
-def test_startup_phase_logic():
-    """Test the startup phase detection logic"""
-    print("Testing startup phase logic...")
+    if not found:
+        # Not finding the process is expected in a cross-container setup
+        logger.debug("Process discovery: NOT FOUND - expected in cross-container setup")
 
-    # Test socket and process detection without returning values
-    test_socket_detection()
-    test_process_discovery()
 
+def test_startup_phase_logic(socket_mode):
+    """Test the startup phase detection logic"""
     # According to our fixed logic:
     # - If socket doesn't exist -> startup phase
     # - If socket exists and is valid -> startup phase complete
     # - Process discovery failure is OK in cross-container setup
 
-    NODE_SOCKET = "/ipc/node.socket"
-    socket_ready = os.path.exists(NODE_SOCKET)
-
-    if socket_ready:
-        print("✅ Startup phase logic: Node should be READY for leadership election")
-        assert True, "Socket ready, node should be ready"
+    if socket_mode is not None:
+        logger.debug(
+            "Startup phase logic: node should be READY for leadership election"
+        )
     else:
-        print("⚠️ Startup phase logic: Node still in STARTUP phase")
         # In test environment, this is expected
-        assert True, "Socket not ready is expected in test environment"
+        logger.debug("Startup phase logic: node still in STARTUP phase")
 
 
 if __name__ == "__main__":
-    print("🔍 Testing Cardano Forge Manager fixes...")
-    print("=" * 50)
-
-    socket_test = test_socket_detection()
-    print()
-
-    process_test = test_process_discovery()
-    print()
-
-    startup_test = test_startup_phase_logic()
-    print()
-
-    print("=" * 50)
-    if socket_test and startup_test:
-        print("✅ Overall: Fixes should resolve the main loop issue")
-        sys.exit(0)
-    else:
-        print("❌ Overall: Issues may persist")
-        sys.exit(1)
+    sys.exit(pytest.main([__file__, "-v", "--log-cli-level=DEBUG"]))